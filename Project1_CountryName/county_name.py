@@ -34,6 +34,32 @@ if countries_file_path:
 else:
     polygons = []
 
+# Convert the polygons to NumPy contours once instead of on every frame
+polygons = [(np.asarray(polygon, np.int32).reshape(-1, 1, 2), name) for polygon, name in polygons]
+
+
+def boxes_overlap(box1, box2):
+    """
+    Check whether two bounding boxes overlap.
+
+    Parameters:
+    - box1: Bounding box (x, y, w, h) of the first polygon.
+    - box2: Bounding box (x, y, w, h) of the second polygon.
+
+    Returns:
+    - overlap: True if the boxes share at least one pixel.
+    """
+    x1, y1, w1, h1 = box1
+    x2, y2, w2, h2 = box2
+    return x1 < x2 + w2 and x2 < x1 + w1 and y1 < y2 + h2 and y2 < y1 + h1
+
+
+# For every country, the countries saved after it whose bounding box overlaps its own.
+# Only those can also contain a point inside the country and take precedence over it.
+boxes = [cv2.boundingRect(polygon_contour) for polygon_contour, _ in polygons]
+later_overlaps = [[j for j in range(i + 1, len(boxes)) if boxes_overlap(boxes[i], boxes[j])]
+                  for i in range(len(boxes))]
+
 # Open a connection to the webcam
 cap = cv2.VideoCapture(cam_id)  # For Webcam
 # Set the width and height of the webcam frame
@@ -49,25 +75,32 @@ detector = HandDetector(staticMode=False,
                         detectionCon=0.5,
                         minTrackCon=0.5)
 
+# Use the OpenCL backend of OpenCV (T-API) for the inverse warp when a device is available
+use_opencl = cv2.ocl.haveOpenCL()
+cv2.ocl.setUseOpenCL(use_opencl)
+
 
-def warp_image(img, points, size=[1920, 1080]):
+# The map does not move, so the transformation and its inverse are computed once
+map_points_f32 = np.asarray(map_points, np.float32)
+destination_points = np.float32([[0, 0], [width, 0], [0, height], [width, height]])
+matrix = cv2.getPerspectiveTransform(map_points_f32, destination_points)
+inv_matrix = np.linalg.inv(matrix)
+
+
+def warp_image(img, matrix, size=[1920, 1080]):
     """
-    Warp the input image based on the provided points to create a top-down view.
+    Warp the input image with the provided transformation matrix to create a top-down view.
 
     Parameters:
     - img: Input image.
-    - points: List of four points representing the region to be warped.
+    - matrix: Perspective transformation matrix from the image to the top-down view.
     - size: Size of the output image.
 
     Returns:
     - imgOutput: Warped image.
-    - matrix: Transformation matrix.
     """
-    pts1 = np.float32([points[0], points[1], points[2], points[3]])
-    pts2 = np.float32([[0, 0], [size[0], 0], [0, size[1]], [size[0], size[1]]])
-    matrix = cv2.getPerspectiveTransform(pts1, pts2)
     imgOutput = cv2.warpPerspective(img, matrix, (size[0], size[1]))
-    return imgOutput, matrix
+    return imgOutput
 
 
 def warp_single_point(point, matrix):
@@ -123,77 +156,135 @@ def get_finger_location(img, imgWarped):
     return warped_point
 
 
-def create_overlay_image(polygons, warped_point, imgOverlay):
+def point_in_country(polygon_contour, warped_point):
+    """
+    Check whether the warped finger location lies inside or on the border of a country.
+
+    Parameters:
+    - polygon_contour: Contour of the country.
+    - warped_point: Coordinates of the index finger tip in the warped image.
+
+    Returns:
+    - inside: True if the point is inside the polygon or on its border.
+    """
+    return cv2.pointPolygonTest(polygon_contour, warped_point, False) >= 0
+
+
+def find_country(polygons, warped_point, prev_idx=None):
     """
-    Create an overlay image with marked polygons based on the warped finger location.
+    Find the country under the warped finger location.
+
+    Where hand-drawn polygons overlap, the country saved last takes precedence, the same rule
+    the label map of the flight time project follows. The country found in the previous frame
+    is tested first, since the finger rarely moves to another country between two frames; only
+    the countries saved after it whose bounding box overlaps it then need to be checked.
 
     Parameters:
-    - polygons: List of polygons representing countries.
+    - polygons: List of (contour, name) tuples representing countries.
     - warped_point: Coordinates of the index finger tip in the warped image.
+    - prev_idx: Index of the country found in the previous frame, or None.
+
+    Returns:
+    - idx: Index of the country under the finger, or None.
+    """
+    candidates, found = range(len(polygons) - 1, -1, -1), None
+    if prev_idx is not None and point_in_country(polygons[prev_idx][0], warped_point):
+        candidates, found = reversed(later_overlaps[prev_idx]), prev_idx
+
+    # loop through the countries, last saved first
+    for idx in candidates:
+        if point_in_country(polygons[idx][0], warped_point):
+            return idx
+
+    return found
+
+
+def create_overlay_image(polygons, idx, imgOverlay):
+    """
+    Create an overlay image with the marked country.
+
+    Parameters:
+    - polygons: List of (contour, name) tuples representing countries.
+    - idx: Index of the country to mark.
     - imgOverlay: Overlay image to be marked.
 
     Returns:
-    - imgOverlay: Overlay image with marked polygons.
-    """
-    # loop through all the countries
-    for polygon, name in polygons:
-        polygon_np = np.array(polygon, np.int32).reshape((-1, 1, 2))
-        result = cv2.pointPolygonTest(polygon_np, warped_point, False)
-        if result >= 0:
-            cv2.polylines(imgOverlay, [np.array(polygon)], isClosed=True, color=(0, 255, 0), thickness=2)
-            cv2.fillPoly(imgOverlay, [np.array(polygon)], (0, 255, 0))
-            cvzone.putTextRect(imgOverlay, name, polygon[0], scale=1, thickness=1)
-            cvzone.putTextRect(imgOverlay, name, (0, 100), scale=8, thickness=5)
+    - imgOverlay: Overlay image with the marked polygon.
+    """
+    polygon_contour, name = polygons[idx]
+    cv2.polylines(imgOverlay, [polygon_contour], isClosed=True, color=(0, 255, 0), thickness=2)
+    cv2.fillPoly(imgOverlay, [polygon_contour], (0, 255, 0))
+    cvzone.putTextRect(imgOverlay, name, polygon_contour[0, 0].tolist(), scale=1, thickness=1)
+    cvzone.putTextRect(imgOverlay, name, (0, 100), scale=8, thickness=5)
 
     return imgOverlay
 
 
-def inverse_warp_image(img, imgOverlay, map_points):
+def inverse_warp_image(imgOverlay, inv_matrix, size):
     """
-    Inverse warp an overlay image onto the original image using provided map points.
+    Inverse warp an overlay image to the perspective of the original image.
 
     Parameters:
-    - img: Original image.
     - imgOverlay: Overlay image to be warped.
-    - map_points: List of four points representing the region on the map.
+    - inv_matrix: Perspective transformation matrix from the top-down view back to the original image.
+    - size: Size of the original image.
 
     Returns:
-    - result: Combined image with the overlay applied.
+    - warped_overlay: Warped overlay image, as a cv2.UMat when OpenCL is used.
     """
-    # Convert map_points to NumPy array
-    map_points = np.array(map_points, dtype=np.float32)
+    # Run the warp on the OpenCL device, freeing the CPU for hand detection
+    if use_opencl:
+        imgOverlay = cv2.UMat(imgOverlay)
 
-    # Define the destination points for the overlay image
-    destination_points = np.array([[0, 0], [imgOverlay.shape[1] - 1, 0], [0, imgOverlay.shape[0] - 1],
-                                   [imgOverlay.shape[1] - 1, imgOverlay.shape[0] - 1]], dtype=np.float32)
+    # Warp the overlay image to fit the perspective of the original image
+    warped_overlay = cv2.warpPerspective(imgOverlay, inv_matrix, size)
 
-    # Calculate the perspective transform matrix
-    M = cv2.getPerspectiveTransform(destination_points, map_points)
+    return warped_overlay
 
-    # Warp the overlay image to fit the perspective of the original image
-    warped_overlay = cv2.warpPerspective(imgOverlay, M, (img.shape[1], img.shape[0]))
 
-    # Combine the original image with the warped overlay
-    result = cv2.addWeighted(img, 1, warped_overlay, 0.65, 0, warped_overlay)
+def blend_overlay_image(img, warped_overlay):
+    """
+    Combine the original image with an inverse warped overlay.
+
+    Parameters:
+    - img: Original image.
+    - warped_overlay: Overlay image returned by inverse_warp_image.
+
+    Returns:
+    - result: Combined image with the overlay applied, as a cv2.UMat when OpenCL is used.
+    """
+    if use_opencl:
+        img = cv2.UMat(img)
+    result = cv2.addWeighted(img, 1, warped_overlay, 0.65, 0)
 
     return result
 
 
+# Country under the finger in the previous frame and its overlay, already warped to the original image.
+# The map and the countries do not move, so the warped overlay stays valid while the country is the same.
+prev_idx = None
+prev_warped_overlay = None
+
 while True:
     # Read a frame from the webcam
     success, img = cap.read()
-    imgWarped, matrix = warp_image(img, map_points)
+    imgWarped = warp_image(img, matrix, [width, height])
     imgOutput = img.copy()
 
     # Find the hand and its landmarks
     warped_point = get_finger_location(img, imgWarped)
 
-    h, w, _ = imgWarped.shape
-    imgOverlay = np.zeros((h, w, 3), dtype=np.uint8)
-
     if warped_point:
-        imgOverlay = create_overlay_image(polygons, warped_point, imgOverlay)
-        imgOutput = inverse_warp_image(img, imgOverlay, map_points)
+        idx = find_country(polygons, warped_point, prev_idx)
+        if idx is not None:
+            # Only redraw and warp the overlay when the finger moved to another country
+            if idx != prev_idx:
+                h, w, _ = imgWarped.shape
+                imgOverlay = np.zeros((h, w, 3), dtype=np.uint8)
+                imgOverlay = create_overlay_image(polygons, idx, imgOverlay)
+                prev_warped_overlay = inverse_warp_image(imgOverlay, inv_matrix, (img.shape[1], img.shape[0]))
+                prev_idx = idx
+            imgOutput = blend_overlay_image(img, prev_warped_overlay)
 
     # imgStacked = cvzone.stackImages([img, imgWarped,imgOutput,imgOverlay], 2, 0.3)
     # cv2.imshow("Stacked Image", imgStacked)
@@ -18,6 +18,7 @@ Libraries:
 - cvzone: A library built on top of OpenCV to simplify certain tasks, including hand tracking.
 - numpy (NumPy): Essential for numerical operations, particularly in handling arrays and image data.
 - HandDetector from cvzone: A pre-built class for detecting and tracking hand movements in real-time.
+- threading, queue: Used to run capture, processing and display as overlapping pipeline stages.
 
 Note:
 - The script assumes the presence of pre-processed data files for map points and country polygons.
@@ -30,6 +31,10 @@ Note:
 
 # Import necessary libraries
 import pickle  # Pickle library for serializing Python objects
+import queue  # Bounded queue between the compute and display stages
+import sys  # Platform check for the camera backend
+import threading  # Threads for the capture, detection and display stages
+import time  # Timing for the hand detection interval
 import cv2  # OpenCV library for computer vision tasks
 import cvzone
 import numpy as np  # NumPy library for numerical operations
@@ -37,9 +42,13 @@ from cvzone.HandTrackingModule import HandDetector
 
 ######################################
 cam_id = 1
+# Capture backend: DirectShow on Windows, Video4Linux on Linux, OpenCV's default elsewhere
+cam_backend = {"win32": cv2.CAP_DSHOW, "linux": cv2.CAP_V4L2}.get(sys.platform, cv2.CAP_ANY)
 width, height = 1920, 1080
 map_file_path = "../Step1-GetCornerPoints/map.p"
 countries_file_path = "../Step2_Get_Country_Polygons/countries.p"
+detection_interval = 0.033  # Seconds between two hand detections
+detection_size = [640, 360]  # Resolution the hand detector runs at
 ######################################
 
 file_obj = open(map_file_path, 'rb')
@@ -56,8 +65,105 @@ if countries_file_path:
 else:
     polygons = []
 
+# Convert the polygons to NumPy contours once instead of on every frame
+polygons = [(np.asarray(polygon, np.int32).reshape(-1, 1, 2), name) for polygon, name in polygons]
+
+# Label map of the countries in the warped image: pixel value i + 1 belongs to country i, 0 to no country
+label_map = np.zeros((height, width), np.uint16)
+for i, (polygon_contour, _) in enumerate(polygons, 1):
+    cv2.fillPoly(label_map, [polygon_contour], i)
+
+
+def find_countries(points):
+    """
+    Find the country under each of the given points with a single lookup in the label map.
+
+    Parameters:
+    - points: Array of warped finger tip coordinates, one row per finger tip.
+
+    Returns:
+    - country_ids: Label of the country under each point, 0 where there is none.
+    """
+    x, y = points[:, 0], points[:, 1]
+    inside = (0 <= x) & (x < label_map.shape[1]) & (0 <= y) & (y < label_map.shape[0])
+    country_ids = np.zeros(len(points), np.uint16)
+    country_ids[inside] = label_map[y[inside], x[inside]]
+    return country_ids
+
+
+def get_warp_matrix(points, size=[1920, 1080]):
+    """
+    Get the perspective transformation from the camera image to the top-down map view.
+
+    Parameters:
+    - points: List of four points representing the map in the camera image.
+    - size: Size of the top-down map view.
+
+    Returns:
+    - matrix: Transformation matrix.
+    """
+    pts1 = np.float32([points[0], points[1], points[2], points[3]])
+    pts2 = np.float32([[0, 0], [size[0], 0], [0, size[1]], [size[0], size[1]]])
+    matrix = cv2.getPerspectiveTransform(pts1, pts2)
+    return matrix
+
+
+# The map does not move, so the transformation is computed once and simply inverted for the way back
+matrix = get_warp_matrix(map_points, [width, height])
+inv_matrix = np.linalg.inv(matrix)
+
+# Country outlines in the camera image, where all the feedback is drawn
+camera_contours = [np.round(cv2.perspectiveTransform(polygon_contour.astype(np.float32), inv_matrix)).astype(np.int32)
+                   for polygon_contour, _ in polygons]
+
+
+def create_country_sprite(polygon_contour, size=[1920, 1080], color=(0, 255, 0)):
+    """
+    Pre-render a country as a filled and outlined sprite so it can be blitted instead of rasterized every frame.
+
+    Parameters:
+    - polygon_contour: Contour of the country in the camera image.
+    - size: Size of the camera image.
+    - color: Color of the country highlight.
+
+    Returns:
+    - sprite: Tuple (x, y, mask, color_sprite) with the top left corner of the sprite, its mask and its colored image.
+    """
+    x, y, w, h = cv2.boundingRect(polygon_contour)
+    # Leave room for the outline, which extends past the polygon itself
+    x0, y0 = max(x - 1, 0), max(y - 1, 0)
+    x1, y1 = min(x + w + 1, size[0]), min(y + h + 1, size[1])
+    mask = np.zeros((y1 - y0, x1 - x0), np.uint8)
+    local_contour = polygon_contour - np.array([x0, y0], np.int32)
+    cv2.fillPoly(mask, [local_contour], 255)
+    cv2.polylines(mask, [local_contour], isClosed=True, color=255, thickness=2)
+    color_sprite = np.full((y1 - y0, x1 - x0, 3), color, np.uint8)
+    return x0, y0, mask, color_sprite
+
+
+def draw_country_sprite(imgOutput, sprite):
+    """
+    Blend a pre-rendered country sprite onto the output image.
+
+    Parameters:
+    - imgOutput: Output image to be marked.
+    - sprite: Sprite created by create_country_sprite.
+    """
+    x, y, mask, color_sprite = sprite
+    h, w = mask.shape
+    roi = imgOutput[y:y + h, x:x + w]
+    blended = cv2.addWeighted(roi, 1, color_sprite, 0.65, 0)
+    cv2.copyTo(blended, mask, roi)
+
+
+# Pre-render every country once at startup
+country_sprites = [create_country_sprite(camera_contour, [width, height]) for camera_contour in camera_contours]
+
 # Open a connection to the webcam
-cap = cv2.VideoCapture(cam_id)  # For Webcam
+cap = cv2.VideoCapture(cam_id, cam_backend)  # For Webcam
+# Request compressed MJPG frames and a single frame driver buffer so frames are never stale
+cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 # Set the width and height of the webcam frame
 cap.set(3, width)
 cap.set(4, height)
@@ -70,6 +176,10 @@ detector = HandDetector(staticMode=False,
                         detectionCon=0.5,
                         minTrackCon=0.5)
 
+# Latest hand detection result, shared between the detection thread and the render loop
+HAND_DETECTION_CACHE = {"hands": None, "ts": 0, "frame": None, "scale": (1, 1)}
+detection_lock = threading.Lock()
+
 flight_time_list = [["USA", "India", "14 hours"],
                     ["USA", "China", "15 hours"],
                     ["Russia", "India", "6 hours"],
@@ -77,25 +187,89 @@ flight_time_list = [["USA", "India", "14 hours"],
                     ["Saudi Arabia", "USA", "14 hours"],
                     ]
 
+# Flight title and time for each pair of countries, looked up regardless of the order of the hands
+flight_times = {frozenset((a, b)): (b + " to " + a, t) for a, b, t in flight_time_list}
+
 
-def warp_image(img, points, size=[1920, 1080]):
+def create_text_sprite(text, scale, thickness, offset=10):
     """
-    Warp the input image based on the provided points to create a top-down view.
+    Pre-render a text box exactly as cvzone.putTextRect draws it, so it can be copied instead of redrawn every frame.
 
     Parameters:
-    - img: Input image.
-    - points: List of four points representing the region to be warped.
-    - size: Size of the output image.
+    - text: Text to render.
+    - scale: Font scale.
+    - thickness: Font thickness.
+    - offset: Padding around the text.
 
     Returns:
-    - imgOutput: Warped image.
-    - matrix: Transformation matrix.
+    - sprite: Tuple (img, mask, top) with the image of the text box, the mask of its drawn pixels and the
+      distance from the top of the sprite to the text baseline.
     """
-    pts1 = np.float32([points[0], points[1], points[2], points[3]])
-    pts2 = np.float32([[0, 0], [size[0], 0], [0, size[1]], [size[0], size[1]]])
-    matrix = cv2.getPerspectiveTransform(pts1, pts2)
-    imgOutput = cv2.warpPerspective(img, matrix, (size[0], size[1]))
-    return imgOutput, matrix
+    font = cv2.FONT_HERSHEY_PLAIN
+    (w, h), baseline = cv2.getTextSize(text, font, scale, thickness)
+    # Descenders (g, y, p, ...) can reach below the box, which only extends offset pixels under the baseline
+    top, bottom = h + offset, max(offset, baseline)
+    img = np.zeros((top + bottom + 1, w + 2 * offset + 1, 3), np.uint8)
+    cvzone.putTextRect(img, text, (offset, top), scale=scale, thickness=thickness, offset=offset)
+    # Only the box and the text are drawn, the rest of the sprite must keep the underlying image
+    mask = np.zeros(img.shape[:2], np.uint8)
+    cv2.rectangle(mask, (0, 0), (w + 2 * offset, h + 2 * offset), 255, cv2.FILLED)
+    cv2.putText(mask, text, (offset, top), font, scale, 255, thickness)
+    return img, mask, top
+
+
+def draw_text_sprite(img, sprite, pos, offset=10):
+    """
+    Blend a text sprite onto the image, at the place cvzone.putTextRect would draw the text at pos.
+
+    Parameters:
+    - img: Image to draw on.
+    - sprite: Sprite created by create_text_sprite.
+    - pos: Bottom left corner of the text.
+    - offset: Padding used when creating the sprite.
+    """
+    sprite_img, mask, top = sprite
+    h, w = mask.shape
+    x0, y0 = pos[0] - offset, pos[1] - top
+    # Clip the sprite to the image borders
+    x1, y1 = max(x0, 0), max(y0, 0)
+    x2, y2 = min(x0 + w, img.shape[1]), min(y0 + h, img.shape[0])
+    if x1 < x2 and y1 < y2:
+        roi = img[y1:y2, x1:x2]
+        # Same weight as the country highlights, like the text drawn on the overlay used to get
+        blended = cv2.addWeighted(roi, 1, sprite_img[y1 - y0:y2 - y0, x1 - x0:x2 - x0], 0.65, 0)
+        cv2.copyTo(blended, mask[y1 - y0:y2 - y0, x1 - x0:x2 - x0], roi)
+
+
+def draw_line(img, pt1, pt2, color, thickness):
+    """
+    Blend a line onto the image with the same weight as the country highlights.
+
+    Parameters:
+    - img: Image to draw on.
+    - pt1: First end point of the line.
+    - pt2: Second end point of the line.
+    - color: Color of the line.
+    - thickness: Thickness of the line.
+    """
+    # Only the bounding box of the line is blended
+    r = thickness // 2 + 1
+    x1, y1 = max(min(pt1[0], pt2[0]) - r, 0), max(min(pt1[1], pt2[1]) - r, 0)
+    x2, y2 = min(max(pt1[0], pt2[0]) + r + 1, img.shape[1]), min(max(pt1[1], pt2[1]) + r + 1, img.shape[0])
+    if x1 < x2 and y1 < y2:
+        roi = img[y1:y2, x1:x2]
+        mask = np.zeros(roi.shape[:2], np.uint8)
+        cv2.line(mask, (pt1[0] - x1, pt1[1] - y1), (pt2[0] - x1, pt2[1] - y1), 255, thickness)
+        blended = cv2.addWeighted(roi, 1, np.full_like(roi, color), 0.65, 0)
+        cv2.copyTo(blended, mask, roi)
+
+
+# Pre-render every text that can be shown: small country labels and large titles
+label_sprites = {name: create_text_sprite(name, 1, 1) for _, name in polygons}
+title_sprites = {name: create_text_sprite(name, 8, 5) for _, name in polygons}
+for title, flight_time in flight_times.values():
+    title_sprites[title] = create_text_sprite(title, 8, 5)
+    title_sprites[flight_time] = create_text_sprite(flight_time, 8, 5)
 
 
 def warp_single_point(point, matrix):
@@ -109,154 +283,232 @@ def warp_single_point(point, matrix):
     Returns:
     - point_warped: Warped coordinates of the point.
     """
-    # Convert the point to homogeneous coordinates
-    point_homogeneous = np.array([[point[0], point[1], 1]], dtype=np.float32)
-
-    # Apply the perspective transformation to the point
-    point_homogeneous_transformed = np.dot(matrix, point_homogeneous.T).T
-
-    # Convert back to non-homogeneous coordinates
-    point_warped = point_homogeneous_transformed[0, :2] / point_homogeneous_transformed[0, 2]
-    point_warped = int(point_warped[0]), int(point_warped[1])
+    # OpenCV applies the transformation and the homogeneous divide in C
+    out = cv2.perspectiveTransform(np.asarray([[point]], np.float32), matrix)
+    point_warped = int(out[0, 0, 0]), int(out[0, 0, 1])
 
     return point_warped
 
 
-def inverse_warp_image(img, imgOverlay, map_points):
+def warp_points(points, matrix):
     """
-    Inverse warp an overlay image onto the original image using provided map points.
+    Warp several points at once using the provided perspective transformation matrix.
 
     Parameters:
-    - img: Original image.
-    - imgOverlay: Overlay image to be warped.
-    - map_points: List of four points representing the region on the map.
+    - points: List of coordinates of the points to be warped.
+    - matrix: Perspective transformation matrix.
 
     Returns:
-    - result: Combined image with the overlay applied.
+    - points_warped: List of warped coordinates of the points.
     """
-    # Convert map_points to NumPy array
-    map_points = np.array(map_points, dtype=np.float32)
-
-    # Define the destination points for the overlay image
-    destination_points = np.array([[0, 0], [imgOverlay.shape[1] - 1, 0], [0, imgOverlay.shape[0] - 1],
-                                   [imgOverlay.shape[1] - 1, imgOverlay.shape[0] - 1]], dtype=np.float32)
+    out = cv2.perspectiveTransform(np.asarray(points, np.float32).reshape(1, -1, 2), matrix)
+    points_warped = [(int(x), int(y)) for x, y in out[0]]
 
-    # Calculate the perspective transform matrix
-    M = cv2.getPerspectiveTransform(destination_points, map_points)
+    return points_warped
 
-    # Warp the overlay image to fit the perspective of the original image
-    warped_overlay = cv2.warpPerspective(imgOverlay, M, (img.shape[1], img.shape[0]))
 
-    # Combine the original image with the warped overlay
-    result = cv2.addWeighted(img, 1, warped_overlay, 0.65, 0, warped_overlay)
+# Positions of the flight time text, anchored to the top left of the map
+title_pos = warp_single_point((0, 100), inv_matrix)
+subtitle_pos = warp_single_point((0, 200), inv_matrix)
 
-    return result
 
-
-def get_finger_location(img, imgWarped):
+def detect_hands():
+    """
+    Detection stage: run the hand detector on the latest frame every detection_interval
+    seconds and store the result in HAND_DETECTION_CACHE.
+    """
+    while True:
+        start = time.time()
+        with detection_lock:
+            frame = HAND_DETECTION_CACHE["frame"]
+        if frame is not None:
+            # Detect on a downscaled copy; the landmarks are scaled back when they are used
+            small = cv2.resize(frame, (detection_size[0], detection_size[1]))
+            hands, _ = detector.findHands(small, draw=False, flipType=True)
+            scale = frame.shape[1] / detection_size[0], frame.shape[0] / detection_size[1]
+            with detection_lock:
+                HAND_DETECTION_CACHE["hands"] = hands
+                HAND_DETECTION_CACHE["scale"] = scale
+                HAND_DETECTION_CACHE["ts"] = start
+        time.sleep(max(0, detection_interval - (time.time() - start)))
+
+
+def get_finger_location():
     """
     Get the location of the index finger tip in the warped image.
 
-    Parameters:
-    - img: Original
-
- image.
+    The hands are read from HAND_DETECTION_CACHE instead of running the detector on every frame.
 
     Returns:
     - warped_point: Coordinates of the index finger tip in the warped image.
+    - indexFingers: List of coordinates of the index finger tips in the camera image.
     """
-    # Find hands in the current frame
-    hands, img = detector.findHands(img, draw=False, flipType=True)
+    # Get the most recently detected hands
+    with detection_lock:
+        hands = HAND_DETECTION_CACHE["hands"]
+        sx, sy = HAND_DETECTION_CACHE["scale"]
     # Check if any hands are detected
     if hands:
-        # Information for the first hand detected
-        hand1 = hands[0]  # Get the first hand detected
-        indexFinger = hand1["lmList"][8][0:2]  # List of 21 landmarks for the first hand
-        # cv2.circle(img,indexFinger,5,(255,0,255),cv2.FILLED)
-        warped_point = warp_single_point(indexFinger, matrix)
-        warped_point = int(warped_point[0]), int(warped_point[1])
-        print(indexFinger, warped_point)
-        cv2.circle(imgWarped, warped_point, 5, (255, 0, 0), cv2.FILLED)
-        if len(hands) == 2:
-            hand2 = hands[1]
-            indexFinger2 = hand2["lmList"][8][0:2]  # List of 21 landmarks for the first hand
-            warped_point2 = warp_single_point(indexFinger2, matrix)
-            cv2.circle(imgWarped, warped_point2, 5, (255, 0, 255), cv2.FILLED)
-            warped_point = [warped_point, warped_point2]
+        # Index finger tip of each hand (landmark 8), scaled back to camera image coordinates
+        indexFingers = [(hand["lmList"][8][0] * sx, hand["lmList"][8][1] * sy) for hand in hands[:2]]
+        # Warp the finger tips of both hands in a single call
+        warped_points = warp_points(indexFingers, matrix)
+        print(indexFingers, warped_points)
+        if len(warped_points) == 2:
+            warped_point = warped_points
+        else:
+            warped_point = warped_points[0]
 
     else:
         warped_point = None
+        indexFingers = []
 
-    return warped_point
+    return warped_point, indexFingers
 
 
-def create_overlay_image(polygons, warped_point, imgOverlay):
+def create_overlay_image(polygons, warped_point, indexFingers, imgOutput):
     """
-    Create an overlay image with marked polygons based on the warped finger location.
+    Mark the countries under the warped finger location directly on the camera image.
 
     Parameters:
-    - polygons: List of polygons representing countries.
+    - polygons: List of (contour, name) tuples representing countries.
     - warped_point: Coordinates of the index finger tip in the warped image.
-    - imgOverlay: Overlay image to be marked.
+    - indexFingers: List of coordinates of the index finger tips in the camera image.
+    - imgOutput: Output image to be marked.
 
     Returns:
-    - imgOverlay: Overlay image with marked polygons.
+    - imgOutput: Output image with marked polygons.
     """
+    # Look up the country under every finger tip
+    points = np.array(warped_point if isinstance(warped_point, list) else [warped_point])
+    country_ids = find_countries(points)
 
     if isinstance(warped_point, list):
-        check = []
-        for warp_point in warped_point:
-            for polygon, name in polygons:
-                polygon_np = np.array(polygon, np.int32).reshape((-1, 1, 2))
-                result = cv2.pointPolygonTest(polygon_np, warp_point, False)
-                if result >= 0:
-                    cv2.polylines(imgOverlay, [np.array(polygon)], isClosed=True, color=(0, 255, 0), thickness=2)
-                    cv2.fillPoly(imgOverlay, [np.array(polygon)], (0, 255, 0))
-                    cvzone.putTextRect(imgOverlay, name, polygon[0], scale=1, thickness=1)
-                    # cvzone.putTextRect(imgOverlay, name, (0, 100), scale=8, thickness=5)
-                    check.append(name)
+        # One label map read covers both fingers; the blends left per hand are too small for worker threads
+        hit_ids = (country_ids[country_ids > 0] - 1).tolist()
+        check = [polygons[idx][1] for idx in hit_ids]
+        # Both fingers may point at the same country, which must only be blended once
+        for idx in dict.fromkeys(hit_ids):
+            _, name = polygons[idx]
+            draw_country_sprite(imgOutput, country_sprites[idx])
+            draw_text_sprite(imgOutput, label_sprites[name], camera_contours[idx][0, 0])
+            # draw_text_sprite(imgOutput, title_sprites[name], title_pos)
         if len(check) == 2:
-            cv2.line(imgOverlay, warped_point[0], warped_point[1], (0, 255, 0), 10)
-            for flight_time in flight_time_list:
-                if check[0] in flight_time and check[1] in flight_time:
-                    cvzone.putTextRect(imgOverlay, flight_time[1] + " to " + flight_time[0], (0, 100), scale=8,
-                                       thickness=5)
-                    cvzone.putTextRect(imgOverlay, flight_time[2], (0, 200), scale=8, thickness=5)
+            # The line is drawn in the camera image, where the finger tips were detected
+            finger_a, finger_b = [(round(x), round(y)) for x, y in indexFingers]
+            draw_line(imgOutput, finger_a, finger_b, (0, 255, 0), 10)
+            flight = flight_times.get(frozenset(check))
+            if flight:
+                title, flight_time = flight
+                draw_text_sprite(imgOutput, title_sprites[title], title_pos)
+                draw_text_sprite(imgOutput, title_sprites[flight_time], subtitle_pos)
     else:
-        # loop through all the countries
-        for polygon, name in polygons:
-            polygon_np = np.array(polygon, np.int32).reshape((-1, 1, 2))
-            result = cv2.pointPolygonTest(polygon_np, warped_point, False)
-            if result >= 0:
-                cv2.polylines(imgOverlay, [np.array(polygon)], isClosed=True, color=(0, 255, 0), thickness=2)
-                cv2.fillPoly(imgOverlay, [np.array(polygon)], (0, 255, 0))
-                cvzone.putTextRect(imgOverlay, name, polygon[0], scale=1, thickness=1)
-                cvzone.putTextRect(imgOverlay, name, (0, 100), scale=8, thickness=5)
+        # mark the country under the finger tip
+        if country_ids[0]:
+            idx = country_ids[0] - 1
+            _, name = polygons[idx]
+            draw_country_sprite(imgOutput, country_sprites[idx])
+            draw_text_sprite(imgOutput, label_sprites[name], camera_contours[idx][0, 0])
+            draw_text_sprite(imgOutput, title_sprites[name], title_pos)
 
-    return imgOverlay
+    return imgOutput
 
 
+class FreshestFrame(threading.Thread):
+    """
+    Capture stage: grab frames from the webcam as fast as the driver delivers them, so none of them go stale.
+
+    Frames are only decoded (retrieved) when read() asks for one, so frames that nobody
+    processes never cost a decode. If the webcam stops delivering frames, read() raises
+    RuntimeError instead of waiting forever.
+    """
+
+    def __init__(self, cap, max_failures=50, timeout=2.0):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.max_failures = max_failures  # Consecutive grab/retrieve failures before giving up
+        self.timeout = timeout  # Seconds read() waits for a frame
+        self.cond = threading.Condition()
+        self.frame = None
+        self.wanted = False  # Set by read() to ask for the next grabbed frame to be decoded
+        self.stopped = False
+
+    def run(self):
+        failures = 0
+        while failures < self.max_failures:
+            # The webcam is only ever accessed from this thread
+            success = self.cap.grab()
+            with self.cond:
+                wanted = self.wanted
+            if success and wanted:
+                success, img = self.cap.retrieve()
+                if success:
+                    with self.cond:
+                        self.frame = img
+                        self.wanted = False
+                        self.cond.notify_all()
+            if success:
+                failures = 0
+            else:
+                failures += 1
+                time.sleep(0.01)
+
+        with self.cond:
+            self.stopped = True
+            self.cond.notify_all()
+
+    def read(self):
+        """
+        Wait for the next grabbed frame and return it.
+
+        Returns:
+        - frame: Newest captured frame.
+        """
+        with self.cond:
+            self.wanted = True
+            received = self.cond.wait_for(lambda: self.stopped or not self.wanted, self.timeout)
+            if self.stopped:
+                raise RuntimeError("Failed to capture image")
+            if not received:
+                raise RuntimeError(f"No image received from the webcam in {self.timeout} seconds")
+            return self.frame
+
+
+# Bounded queue between the compute and display stages
+display_q = queue.Queue(maxsize=2)
+
+
+def writer():
+    """
+    Display stage: show the processed frames pushed to display_q.
+    """
+    while True:
+        imgOutput = display_q.get()
+        # cv2.imshow("Original Image", img)
+        cv2.imshow("Output Image", imgOutput)
+
+        key = cv2.waitKey(1)
+
+
+grabber = FreshestFrame(cap)
+grabber.start()
+threading.Thread(target=writer, daemon=True).start()
+threading.Thread(target=detect_hands, daemon=True).start()
+
 while True:
-    # Read a frame from the webcam
-    success, img = cap.read()
-    imgWarped, matrix = warp_image(img, map_points)
+    # Get the newest captured frame
+    img = grabber.read()
     imgOutput = img.copy()
 
-    # Find the hand and its landmarks
-    warped_point = get_finger_location(img, imgWarped)
+    # Hand the newest frame to the detection thread
+    with detection_lock:
+        HAND_DETECTION_CACHE["frame"] = img
 
-    h, w, _ = imgWarped.shape
-    imgOverlay = np.zeros((h, w, 3), dtype=np.uint8)
+    # Find the hand and its landmarks
+    warped_point, indexFingers = get_finger_location()
 
     if warped_point:
-        imgOverlay = create_overlay_image(polygons, warped_point, imgOverlay)
-        imgOutput = inverse_warp_image(img, imgOverlay, map_points)
-
-    # imgStacked = cvzone.stackImages([img, imgWarped,imgOutput,imgOverlay], 2, 0.3)
-    # cv2.imshow("Stacked Image", imgStacked)
-
-    # cv2.imshow("Original Image", img)
-    # cv2.imshow("Warped Image", imgWarped)
-    cv2.imshow("Output Image", imgOutput)
+        imgOutput = create_overlay_image(polygons, warped_point, indexFingers, imgOutput)
 
-    key = cv2.waitKey(1)
\ No newline at end of file
+    # Blocks when the display stage falls behind, keeping memory bounded
+    display_q.put(imgOutput, block=True)
@@ -1,15 +1,19 @@
 import pickle
+import sys
 import cv2
 import numpy as np
 
 #########################
 # Camera settings
 cam_id = 1  # Change this to your desired camera ID, try 0 for default webcam
+cam_backend = {"win32": cv2.CAP_DSHOW, "linux": cv2.CAP_V4L2}.get(sys.platform, cv2.CAP_ANY)  # Capture backend
 width, height = 1920, 1080  # Change this to desired image resolution
 #########################
 
 # Initialize variables
-cap = cv2.VideoCapture(cam_id)  # For Webcam
+cap = cv2.VideoCapture(cam_id, cam_backend)  # For Webcam
+cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))  # Compressed frames for 1080p at full frame rate
+cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Do not queue stale frames in the driver
 cap.set(3, width)  # Set width
 cap.set(4, height)  # Set height
 points = np.zeros((4, 2), int)  # Array to store clicked points